@@ -9,12 +9,19 @@ mittels Gesichtserkennung und Clustering.
 import os
 import shutil
 import argparse
+import queue
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import cv2
 import numpy as np
 from deepface import DeepFace
+from deepface.modules import preprocessing
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 from sklearn.cluster import DBSCAN
 from tqdm import tqdm
 
@@ -23,23 +30,118 @@ from tqdm import tqdm
 VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mov', '.mkv', '.webm', '.flv', '.wmv'}
 FRAMES_TO_EXTRACT = 20
 SKIP_PERCENT = 0.10  # Erste und letzte 10% überspringen (Intros/Outros)
+KEYFRAME_PROBE_PACKETS = 600  # Maximal gelesene Pakete beim Bestimmen des Keyframe-Abstands
+FALLBACK_KEYFRAME_INTERVAL = 120  # Falls sich der Keyframe-Abstand nicht bestimmen lässt
 EMBEDDING_MODEL = "ArcFace"
 DETECTOR_BACKEND = "retinaface"  # Alternativen: "yolov8", "mtcnn", "opencv"
+EMBEDDING_DTYPE = np.float16  # Speicherformat der Video-Fingerabdrücke
+DETECT_MAX_DIM = 720  # Größere Frames werden nur für die Gesichtserkennung verkleinert
+FACE_TRACK_MARGIN = 1.0  # Suchbereich um das vorherige Gesicht (in Gesichtsgrößen pro Seite)
+FACE_TRACK_MIN_AREA = 0.5  # Mindestfläche relativ zum vorherigen Gesicht, sonst ganzer Frame
+FACE_TRACK_MAX_SHIFT = 0.5  # Maximale Verschiebung der Gesichtsmitte (in Gesichtsgrößen)
+FACE_TRACK_MAX_GAP = 60  # Nur bei höchstens so vielen Frames Abstand wird verfolgt
+
+GPU_WORKERS = 3  # Threads, die sich eine GPU teilen
+FRAME_QUEUE_SIZE = 4  # Vorausdekodierte Frames pro Video
+COPY_WORKERS = 4  # Parallele Kopien beim Verschieben über Dateisystemgrenzen
+
+# Einmalig geladenes Embedding-Modell (siehe load_models)
+_ARCFACE = None
+
+# Serialisiert die Embedding-Berechnung, wenn mehrere Threads eine GPU teilen
+_GPU_LOCK = threading.Semaphore(1)
+
+
+def load_models(tf_threads: Optional[int] = None) -> None:
+    """
+    Lädt Embedding-Modell und Gesichtsdetektor einmalig und wärmt beide auf,
+    damit der erste Video-Durchlauf nicht die Initialisierungskosten trägt.
+    Der Detektor wird über den Dummy-Aufruf von DeepFace.extract_faces in
+    DeepFaces internem Modell-Cache angelegt, den auch detect_largest_face nutzt.
+
+    Args:
+        tf_threads: Optionale Obergrenze für TensorFlows Intra-/Inter-Op-Threads,
+            muss vor dem ersten TensorFlow-Aufruf im Prozess gesetzt werden
+    """
+    global _ARCFACE
+
+    if _ARCFACE is not None:
+        return
+
+    if tf_threads is not None:
+        import tensorflow as tf
+        tf.config.threading.set_intra_op_parallelism_threads(tf_threads)
+        tf.config.threading.set_inter_op_parallelism_threads(tf_threads)
+
+    _ARCFACE = DeepFace.build_model(EMBEDDING_MODEL)
+
+    # Warmup: je ein Dummy-Durchlauf durch Embedder und Detektor
+    height, width = _ARCFACE.input_shape
+    _ARCFACE.forward(np.zeros((1, height, width, 3), dtype=np.float32))
+    DeepFace.extract_faces(
+        img_path=np.zeros((height, width, 3), dtype=np.uint8),
+        detector_backend=DETECTOR_BACKEND,
+        enforce_detection=False
+    )
+
+
+def gpu_available() -> bool:
+    """Prüft, ob TensorFlow eine GPU zur Verfügung hat."""
+    try:
+        import tensorflow as tf
+    except ImportError:
+        return False
+    return bool(tf.config.list_physical_devices('GPU'))
 
 
 def get_video_files(source_dir: Path) -> list[Path]:
     """Findet alle Videodateien im Quellordner."""
-    video_files = []
-    for file in source_dir.iterdir():
-        if file.is_file() and file.suffix.lower() in VIDEO_EXTENSIONS:
-            video_files.append(file)
-    return sorted(video_files)
+    # os.scandir liefert den Dateityp aus dem Verzeichniseintrag, ohne stat() pro Datei
+    with os.scandir(source_dir) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS
+            and entry.is_file()
+        )
+
+
+def get_keyframe_interval(video_path: Path) -> int:
+    """
+    Bestimmt den Abstand der ersten beiden Keyframes in Frames. Dafür werden nur
+    die komprimierten Pakete gelesen, ohne sie zu dekodieren.
+    """
+    cap = cv2.VideoCapture(str(video_path), cv2.CAP_FFMPEG, [cv2.CAP_PROP_FORMAT, -1])
+
+    try:
+        previous_keyframe = None
 
+        for index in range(KEYFRAME_PROBE_PACKETS):
+            if not cap.grab():
+                break
 
-def extract_frames(video_path: Path, num_frames: int = FRAMES_TO_EXTRACT) -> list[np.ndarray]:
+            if cap.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME):
+                if previous_keyframe is not None:
+                    return index - previous_keyframe
+                previous_keyframe = index
+    finally:
+        cap.release()
+
+    # Nur ein Keyframe im untersuchten Bereich: Abstand ist mindestens so groß
+    if previous_keyframe is not None:
+        return KEYFRAME_PROBE_PACKETS
+
+    return FALLBACK_KEYFRAME_INTERVAL
+
+
+def extract_frames(
+    video_path: Path,
+    num_frames: int = FRAMES_TO_EXTRACT
+) -> Iterator[tuple[int, np.ndarray]]:
     """
     Extrahiert Frames aus einem Video in regelmäßigen Abständen.
     Überspringt die ersten und letzten 10% des Videos.
+    Die Frames werden einzeln als (Frame-Index, Frame) geliefert, sobald sie dekodiert sind.
     """
     cap = cv2.VideoCapture(str(video_path))
 
@@ -64,82 +166,294 @@ def extract_frames(video_path: Path, num_frames: int = FRAMES_TO_EXTRACT) -> lis
         step = usable_frames / num_frames
         frame_indices = [int(start_frame + i * step) for i in range(num_frames)]
 
-    frames = []
-    for frame_idx in frame_indices:
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-        ret, frame = cap.read()
-        if ret:
-            # BGR zu RGB konvertieren (DeepFace erwartet RGB)
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            frames.append(frame_rgb)
+    # Ein Seek dekodiert ab dem vorherigen Keyframe, also bis zu einem Keyframe-Abstand.
+    # Nur bei größeren Lücken ist Springen günstiger als sequentielles Weiterlesen.
+    seek_threshold = get_keyframe_interval(video_path)
+    position = 0  # Index des Frames, den der nächste grab() liefert
+
+    try:
+        for frame_idx in frame_indices:
+            if frame_idx - position > seek_threshold:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+                position = frame_idx
+
+            # Sequentiell bis zum Ziel-Frame vorspulen, ohne Zwischenframes zu konvertieren
+            grabbed = True
+            while grabbed and position <= frame_idx:
+                grabbed = cap.grab()
+                position += 1
+
+            if not grabbed:
+                continue
+
+            ret, frame = cap.retrieve()
+            if ret:
+                # Frames bleiben in BGR: DeepFace erwartet NumPy-Bilder in OpenCV-Reihenfolge,
+                # eine Farbkonvertierung pro Frame ist daher nicht nötig
+                yield frame_idx, frame
+    finally:
+        cap.release()
+
+
+def prefetch_frames(
+    video_path: Path,
+    num_frames: int = FRAMES_TO_EXTRACT
+) -> Iterator[tuple[int, np.ndarray]]:
+    """
+    Dekodiert die Frames in einem Hintergrund-Thread, damit Dekodierung und
+    Gesichtserkennung überlappen. Fehler des Decoders werden beim Konsumenten ausgelöst.
+    """
+    frame_queue = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+    end_of_stream = object()
+
+    def decode():
+        try:
+            for item in extract_frames(video_path, num_frames):
+                frame_queue.put(item)
+        except Exception as e:
+            frame_queue.put(e)
+        frame_queue.put(end_of_stream)
+
+    threading.Thread(target=decode, daemon=True).start()
 
-    cap.release()
-    return frames
+    while (item := frame_queue.get()) is not end_of_stream:
+        if isinstance(item, Exception):
+            raise item
+        yield item
 
 
-def get_largest_face_embedding(frame: np.ndarray) -> Optional[np.ndarray]:
+def detect_largest_face(image: np.ndarray) -> Optional[dict]:
     """
-    Findet das größte Gesicht im Frame und gibt dessen Embedding zurück.
+    Findet das größte Gesicht im Bild und gibt das DeepFace-Ergebnis
+    (ausgerichteter Ausschnitt unter 'face', Bounding Box unter 'facial_area') zurück.
     Gibt None zurück, wenn kein Gesicht gefunden wird.
     """
     try:
-        # Gesichtserkennung mit Embeddings
-        results = DeepFace.represent(
-            img_path=frame,
-            model_name=EMBEDDING_MODEL,
+        # Nur Gesichtserkennung, Embeddings werden später im Batch berechnet.
+        # color_face='bgr' liefert den Ausschnitt in BGR, so wie DeepFace.represent
+        # ihn an das Modell weitergibt.
+        faces = DeepFace.extract_faces(
+            img_path=image,
             detector_backend=DETECTOR_BACKEND,
             enforce_detection=True,
-            align=True
+            align=True,
+            color_face='bgr'
         )
 
-        if not results:
+        if not faces:
             return None
 
         # Bei mehreren Gesichtern: das größte auswählen (größte Bounding Box)
-        if len(results) > 1:
-            largest_face = max(
-                results,
-                key=lambda x: x['facial_area']['w'] * x['facial_area']['h']
-            )
-        else:
-            largest_face = results[0]
-
-        return np.array(largest_face['embedding'])
+        return max(
+            faces,
+            key=lambda x: x['facial_area']['w'] * x['facial_area']['h']
+        )
 
     except Exception:
         # Kein Gesicht gefunden oder anderer Fehler
         return None
 
 
-def compute_video_fingerprint(video_path: Path) -> Optional[np.ndarray]:
+def downscale_for_detection(frame: np.ndarray) -> tuple[np.ndarray, float]:
+    """
+    Verkleinert den Frame für die Gesichtserkennung auf höchstens DETECT_MAX_DIM Pixel
+    Kantenlänge, da die Detektor-Kosten mit der Pixelzahl skalieren.
+    Gibt (verkleinerte Kopie, Skalierungsfaktor) zurück.
+    """
+    max_dim = max(frame.shape[:2])
+    if max_dim <= DETECT_MAX_DIM:
+        return frame, 1.0
+
+    scale = DETECT_MAX_DIM / max_dim
+    small = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    return small, scale
+
+
+def crop_aligned_face(frame: np.ndarray, area: dict, scale: float) -> np.ndarray:
+    """
+    Schneidet das Gesicht aus dem Frame in voller Auflösung aus. area ist die Bounding Box
+    im um scale verkleinerten Bild. Wie bei DeepFace (align=True) wird der Ausschnitt
+    um seine Mitte gedreht, bis die Augen waagerecht liegen.
+    """
+    x, y, w, h = (area[k] / scale for k in ('x', 'y', 'w', 'h'))
+    center_x, center_y = x + w / 2, y + h / 2
+
+    # Winkel wie in DeepFaces align_img_wrt_eyes, unabhängig von der Skalierung
+    angle = 0.0
+    left_eye, right_eye = area.get('left_eye'), area.get('right_eye')
+    if left_eye is not None and right_eye is not None:
+        angle = float(np.degrees(np.arctan2(left_eye[1] - right_eye[1],
+                                            left_eye[0] - right_eye[0])))
+
+    # Drehung um die Gesichtsmitte, danach die Box in den Ursprung verschieben
+    matrix = cv2.getRotationMatrix2D((center_x, center_y), angle, 1.0)
+    matrix[0, 2] += w / 2 - center_x
+    matrix[1, 2] += h / 2 - center_y
+
+    return cv2.warpAffine(
+        frame, matrix, (max(1, round(w)), max(1, round(h))),
+        flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_CONSTANT, borderValue=(0, 0, 0)
+    )
+
+
+def get_largest_face(
+    frame: np.ndarray,
+    previous_area: Optional[dict] = None
+) -> Optional[tuple[np.ndarray, dict]]:
+    """
+    Findet das größte Gesicht im Frame und gibt (Gesichtsausschnitt, Bounding Box) zurück.
+    Die Erkennung läuft auf einer verkleinerten Kopie, der Ausschnitt für ArcFace stammt
+    aus dem Frame in voller Auflösung. Die Bounding Box bezieht sich auf die verkleinerte
+    Kopie und kann als previous_area an den nächsten Aufruf übergeben werden.
+    Ist sie bekannt (nur bei kurz aufeinanderfolgenden Frames sinnvoll), wird zuerst nur
+    der Bereich um sie herum durchsucht. Ein Gesicht von dort wird nur übernommen, wenn
+    es ähnlich groß ist und kaum verschoben liegt, sonst wird der ganze Frame durchsucht.
+    Gibt None zurück, wenn kein Gesicht gefunden wird.
+    """
+    full_frame = frame
+    frame, scale = downscale_for_detection(full_frame)
+
+    if previous_area is not None:
+        x, y, w, h = (previous_area[k] for k in ('x', 'y', 'w', 'h'))
+        margin_x = int(w * FACE_TRACK_MARGIN)
+        margin_y = int(h * FACE_TRACK_MARGIN)
+        x0, y0 = max(0, x - margin_x), max(0, y - margin_y)
+        x1 = min(frame.shape[1], x + w + margin_x)
+        y1 = min(frame.shape[0], y + h + margin_y)
+
+        face = detect_largest_face(np.ascontiguousarray(frame[y0:y1, x0:x1]))
+
+        if face is not None:
+            area = face['facial_area']
+            # Verschiebung der Gesichtsmitte gegenüber dem vorherigen Frame
+            shift_x = abs(area['x'] + x0 + area['w'] / 2 - (x + w / 2))
+            shift_y = abs(area['y'] + y0 + area['h'] / 2 - (y + h / 2))
+
+            if (area['w'] * area['h'] >= FACE_TRACK_MIN_AREA * w * h
+                    and shift_x <= FACE_TRACK_MAX_SHIFT * w
+                    and shift_y <= FACE_TRACK_MAX_SHIFT * h):
+                # Bounding Box und Augen zurück in Frame-Koordinaten umrechnen
+                region = {'x': area['x'] + x0, 'y': area['y'] + y0, 'w': area['w'], 'h': area['h']}
+                for eye in ('left_eye', 'right_eye'):
+                    if area.get(eye) is not None:
+                        region[eye] = (area[eye][0] + x0, area[eye][1] + y0)
+                return crop_aligned_face(full_frame, region, scale), region
+
+    face = detect_largest_face(frame)
+    if face is None:
+        return None
+
+    return crop_aligned_face(full_frame, face['facial_area'], scale), face['facial_area']
+
+
+def compute_face_embeddings(faces: list[np.ndarray]) -> np.ndarray:
+    """
+    Berechnet die Embeddings aller Gesichtsausschnitte in einem einzigen Forward-Pass.
+    Gibt ein Array der Form (Anzahl Gesichter, Embedding-Dimension) zurück.
+    """
+    load_models()
+    height, width = _ARCFACE.input_shape
+
+    # Alle Ausschnitte auf die Modell-Eingabegröße bringen, direkt in einen
+    # vorab allokierten, zusammenhängenden Batch
+    batch = np.empty((len(faces), height, width, 3), dtype=np.float32)
+    for i, face in enumerate(faces):
+        batch[i] = preprocessing.resize_image(img=face, target_size=(width, height))[0]
+
+    with _GPU_LOCK:
+        embeddings = _ARCFACE.forward(batch)
+
+    embeddings = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+
+    # Ältere DeepFace-Versionen liefern bei einem Batch nur das erste Embedding
+    if embeddings.shape[0] != len(faces):
+        raise RuntimeError(
+            f"ArcFace lieferte {embeddings.shape[0]} Embeddings für {len(faces)} Gesichter "
+            f"(deepface>=0.0.94 erforderlich)"
+        )
+
+    return embeddings
+
+
+def compute_video_fingerprint(video_path: Path) -> tuple[str, Optional[np.ndarray]]:
     """
     Erstellt einen Video-Fingerabdruck als Durchschnittsvektor aller Gesichts-Embeddings.
-    Gibt None zurück, wenn keine Gesichter gefunden wurden.
+    Gibt (Dateiname, Embedding) zurück, Embedding ist None, wenn keine Gesichter gefunden wurden.
     """
+    # Pass 1: Größtes Gesicht pro Frame erkennen, während der nächste Frame dekodiert wird
+    faces = []
+    previous_area = None
+    previous_idx = None
+
     try:
-        frames = extract_frames(video_path)
+        for frame_idx, frame in prefetch_frames(video_path):
+            # Nur kurz nach dem letzten Gesicht steht der Haupttänzer noch an derselben Stelle
+            tracked_area = None
+            if previous_idx is not None and frame_idx - previous_idx <= FACE_TRACK_MAX_GAP:
+                tracked_area = previous_area
+
+            result = get_largest_face(frame, tracked_area)
+            if result is not None:
+                face, previous_area = result
+                previous_idx = frame_idx
+                faces.append(face)
     except ValueError:
-        return None
-
-    embeddings = []
+        return video_path.name, None
 
-    for frame in frames:
-        embedding = get_largest_face_embedding(frame)
-        if embedding is not None:
-            embeddings.append(embedding)
+    if not faces:
+        return video_path.name, None
 
-    if not embeddings:
-        return None
+    # Pass 2: Alle Gesichter in einem Batch einbetten
+    embeddings = compute_face_embeddings(faces)
 
-    # Durchschnittsvektor berechnen
-    mean_embedding = np.mean(embeddings, axis=0)
+    # Durchschnittsvektor über die (N, D)-Matrix berechnen
+    mean_embedding = embeddings.mean(axis=0)
 
-    # Normalisieren für Cosine-Distanz
+    # Normalisieren für Cosine-Distanz (in-place)
     norm = np.linalg.norm(mean_embedding)
     if norm > 0:
-        mean_embedding = mean_embedding / norm
+        mean_embedding /= norm
+
+    # Als float16 ablegen: halbiert Speicher und Transfer aus den Worker-Prozessen,
+    # die Winkelstruktur der normalisierten Vektoren bleibt erhalten
+    return video_path.name, mean_embedding.astype(EMBEDDING_DTYPE)
 
-    return mean_embedding
+
+def compute_video_fingerprints(
+    video_files: list[Path],
+    workers: int = 1
+) -> Iterator[tuple[str, Optional[np.ndarray]]]:
+    """
+    Berechnet die Fingerabdrücke mehrerer Videos, bei workers > 1 parallel.
+    Ohne GPU rechnet jeder Prozess mit eigenen Modellen, mit GPU teilen sich
+    wenige Threads das Gerät, damit Decoding und Erkennung überlappen.
+    Liefert die (Dateiname, Embedding)-Tupel in der Reihenfolge von video_files.
+    """
+    if workers <= 1:
+        load_models()
+        yield from map(compute_video_fingerprint, video_files)
+        return
+
+    if gpu_available():
+        load_models()
+        executor = ThreadPoolExecutor(max_workers=min(workers, GPU_WORKERS))
+    else:
+        # Einmal im Hauptprozess laden, damit die Gewichte beim ersten Start nur
+        # einmal heruntergeladen werden und nicht von jedem Worker gleichzeitig
+        load_models()
+
+        # TensorFlow nutzt pro Prozess standardmäßig alle Kerne, ohne Begrenzung
+        # liefen workers × Kerne Rechen-Threads gegeneinander
+        tf_threads = max(1, (os.cpu_count() or 1) // workers)
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=load_models,
+            initargs=(tf_threads,)
+        )
+
+    with executor:
+        yield from executor.map(compute_video_fingerprint, video_files, chunksize=1)
 
 
 def cluster_videos(
@@ -152,16 +466,27 @@ def cluster_videos(
     Gibt ein Dictionary mit Dateiname -> Cluster-ID zurück.
     """
     filenames = list(video_embeddings.keys())
-    embeddings = np.array([video_embeddings[f] for f in filenames])
-
-    # DBSCAN mit Cosine-Distanz
-    clustering = DBSCAN(
-        eps=eps,
-        min_samples=min_samples,
-        metric='cosine'
-    ).fit(embeddings)
+    embeddings = np.vstack([video_embeddings[f] for f in filenames]).astype(np.float32)
+
+    # float16-Fingerabdrücke für die GEMM auf float32 heben (NumPy hat kein BLAS für float16).
+    # Embeddings sind L2-normalisiert: Cosine-Distanz = 1 - X @ X.T
+    distances = 1.0 - embeddings @ embeddings.T
+    np.clip(distances, 0.0, None, out=distances)
+    np.fill_diagonal(distances, 0.0)
+
+    if min_samples <= 1:
+        # Jedes Video ist Kernpunkt: DBSCAN-Cluster sind die
+        # Zusammenhangskomponenten des eps-Nachbarschaftsgraphen
+        _, labels = connected_components(csr_matrix(distances <= eps), directed=False)
+    else:
+        # DBSCAN auf der vorberechneten Distanzmatrix
+        labels = DBSCAN(
+            eps=eps,
+            min_samples=min_samples,
+            metric='precomputed'
+        ).fit(distances).labels_
 
-    return {filename: label for filename, label in zip(filenames, clustering.labels_)}
+    return {filename: int(label) for filename, label in zip(filenames, labels)}
 
 
 def organize_videos(
@@ -196,23 +521,40 @@ def organize_videos(
             dancer_dir.mkdir(exist_ok=True)
             cluster_dirs[cluster_id] = dancer_dir
 
-    moved_files = {}
+    moves = {}
 
-    # Error-Dateien verschieben
+    # Error-Dateien
     for filename in error_files:
-        src = source_dir / filename
-        dst = error_dir / filename
-        if src.exists():
-            shutil.move(str(src), str(dst))
-            moved_files[filename] = dst
+        moves[filename] = (source_dir / filename, error_dir / filename)
 
-    # Geclusterte Dateien verschieben
+    # Geclusterte Dateien
     for filename, cluster_id in cluster_assignments.items():
-        src = source_dir / filename
-        dst = cluster_dirs[cluster_id] / filename
-        if src.exists():
-            shutil.move(str(src), str(dst))
+        moves[filename] = (source_dir / filename, cluster_dirs[cluster_id] / filename)
+
+    moved_files = {}
+    copy_moves = {}
+
+    # Auf demselben Dateisystem ist os.rename sofort fertig, unabhängig von der Dateigröße
+    for filename, (src, dst) in moves.items():
+        if not src.exists():
+            continue
+        try:
+            os.rename(src, dst)
             moved_files[filename] = dst
+        except OSError:
+            # z.B. anderes Dateisystem (EXDEV): Kopieren + Löschen nötig
+            copy_moves[filename] = (src, dst)
+
+    # Verbleibende Dateien parallel kopieren, damit mehrere Kopien gleichzeitig laufen
+    if copy_moves:
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+            futures = {
+                filename: executor.submit(shutil.move, str(src), str(dst))
+                for filename, (src, dst) in copy_moves.items()
+            }
+            for filename, future in futures.items():
+                future.result()
+                moved_files[filename] = copy_moves[filename][1]
 
     return moved_files
 
@@ -244,6 +586,12 @@ def main():
         default=1,
         help="DBSCAN min_samples-Parameter (Standard: 1)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) // 2),
+        help="Anzahl paralleler Analyse-Worker (Standard: Hälfte der CPU-Kerne)"
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -277,13 +625,14 @@ def main():
     video_embeddings = {}
     error_files = []
 
-    for video_path in tqdm(video_files, desc="Analysiere Videos", unit="video"):
-        embedding = compute_video_fingerprint(video_path)
+    fingerprints = compute_video_fingerprints(video_files, workers=args.workers)
 
+    for name, embedding in tqdm(fingerprints, total=len(video_files),
+                                desc="Analysiere Videos", unit="video"):
         if embedding is not None:
-            video_embeddings[video_path.name] = embedding
+            video_embeddings[name] = embedding
         else:
-            error_files.append(video_path.name)
+            error_files.append(name)
 
     print(f"\nErfolgreich analysiert: {len(video_embeddings)} Videos")
     print(f"Fehlgeschlagen (keine Gesichter): {len(error_files)} Videos")
@@ -7,11 +7,104 @@ Nutzt FFmpeg für volle Audio-Unterstützung und Smartphone-Kompatibilität.
 """
 
 import argparse
+import csv
+import json
+import os
 import re
 import shlex
+import shutil
+import struct
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import NamedTuple, Optional
+
+
+# Standardwerte für Threads pro FFmpeg-Prozess und gleichzeitig laufende Prozesse
+FFMPEG_THREADS = 2
+PARALLEL_JOBS = max(1, (os.cpu_count() or 2) // 2)
+
+# Maximale Anzahl Clips, die bei Stream-Copy ein gemeinsamer FFmpeg-Prozess schneidet
+MULTI_OUTPUT_MAX_CLIPS = 16
+
+# Gleichzeitige Encodes mit Hardware-Encoder (mehr bringen auf einer GPU keinen Durchsatz)
+HW_PARALLEL_JOBS = 2
+
+# Hardware-Beschleunigungen, in der Reihenfolge, in der --hwaccel auto sie versucht
+HWACCEL_PRIORITY = ['nvenc', 'qsv', 'videotoolbox', 'vaapi']
+
+# Render-Device für VAAPI (Linux)
+VAAPI_DEVICE = '/dev/dri/renderD128'
+
+# Maximale Bytes, die vor dem Schnitt eines Clips im Voraus von der Quelle gelesen werden
+PREFETCH_MAX_BYTES = 256 * 1024 * 1024
+
+# Anzahl der letzten FFmpeg-Fehlerzeilen, die bei einem fehlgeschlagenen Clip angezeigt werden
+ERROR_TAIL_LINES = 5
+
+# Cache für per ffprobe ermittelte Videolängen (Pfad -> [mtime_ns, Größe, Dauer])
+DURATION_CACHE_FILE = Path.home() / '.cache' / 'fancam_splitter' / 'durations.json'
+
+
+# MM:SS oder HH:MM:SS, Sekunden optional mit Nachkommastellen
+_TIME_PATTERN = re.compile(r'^(?:(\d+):)?(\d+):(\d+(?:\.\d+)?)$')
+
+# Eine Zeile der Timestamp-Datei: "START: <Offset>" oder "MM:SS Titel" / "HH:MM:SS Titel".
+# Die Zeitfelder werden einzeln erfasst, bei MM:SS ist das dritte Feld leer.
+_LINE_PATTERN = re.compile(
+    r'^[^\S\n]*(?:START:[^\S\n]*(?P<offset>.*?)'
+    r'|(?P<t1>\d{1,2}):(?P<t2>\d{2})(?::(?P<t3>\d{2}))?[^\S\n]+(?P<title>.+?))[^\S\n]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Übersetzungstabellen und Muster für sanitize_filename
+_INVALID_CHARS_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+_SPACE_TABLE = str.maketrans({' ': '_'})
+_MULTI_UNDERSCORE_PATTERN = re.compile(r'_+')
+
+# Dateiendungen, deren Dauer direkt aus dem mvhd-Atom gelesen wird
+_MP4_EXTENSIONS = {'.mp4', '.m4v', '.mov'}
+
+# Boxtypen, mit denen eine MP4/MOV-Datei beginnen kann
+_MP4_TOP_LEVEL_BOXES = {b'ftyp', b'moov', b'mdat', b'free', b'skip', b'wide', b'pnot'}
+
+# Inhalt von DURATION_CACHE_FILE, wird beim ersten Zugriff geladen
+_duration_cache: Optional[dict] = None
+
+# Namen der Encoder der installierten FFmpeg-Version, wird beim ersten Zugriff ermittelt
+_ffmpeg_encoders: Optional[set[str]] = None
+
+# Eingabe-Argumente pro Hardware-Beschleunigung (Dekodierung und Geräte-Initialisierung)
+_HWACCEL_INPUT_ARGS = {
+    'none': [],
+    'nvenc': ['-hwaccel', 'cuda'],
+    'qsv': [],
+    'videotoolbox': ['-hwaccel', 'videotoolbox'],
+    'vaapi': [
+        '-init_hw_device', f'vaapi=va:{VAAPI_DEVICE}',
+        '-filter_hw_device', 'va',
+        '-hwaccel', 'vaapi',
+        '-hwaccel_device', 'va',
+        '-hwaccel_output_format', 'vaapi',
+    ],
+}
+
+# x264-Presets auf NVENC-Presets (p1 = schnellste, p7 = beste Qualität) abbilden
+_NVENC_PRESETS = {
+    'ultrafast': 'p1', 'superfast': 'p1', 'veryfast': 'p2', 'faster': 'p3', 'fast': 'p4',
+    'medium': 'p5', 'slow': 'p6', 'slower': 'p7', 'veryslow': 'p7',
+}
+
+
+class Clip(NamedTuple):
+    """Ein zu schneidender Clip (Start, Dauer und Länge der Quelle in Sekunden)."""
+    input_path: Path
+    output_path: Path
+    start: float
+    duration: float
+    source_duration: float
 
 
 def parse_time_to_seconds(time_str: str) -> float:
@@ -24,23 +117,19 @@ def parse_time_to_seconds(time_str: str) -> float:
     Returns:
         Zeit in Sekunden als float
     """
-    parts = time_str.strip().split(':')
-
-    if len(parts) == 2:
-        # MM:SS Format
-        minutes, seconds = parts
-        return int(minutes) * 60 + float(seconds)
-    elif len(parts) == 3:
-        # HH:MM:SS Format
-        hours, minutes, seconds = parts
-        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
-    else:
+    match = _TIME_PATTERN.match(time_str.strip())
+    if not match:
         raise ValueError(f"Ungültiges Zeitformat: {time_str}")
 
+    hours, minutes, seconds = match.groups()
+    return int(hours or 0) * 3600 + int(minutes) * 60 + float(seconds)
 
-def parse_timestamp_file(filepath: Path) -> list[dict]:
+
+def parse_timestamp_file(
+    filepath: Path
+) -> tuple[list[float], list[Optional[float]], list[str]]:
     """
-    Parst eine Timestamp-Datei und gibt eine Liste von Clips zurück.
+    Parst eine Timestamp-Datei und gibt die Clips als parallele Listen zurück.
 
     Format der Datei:
         START: 01:30
@@ -51,46 +140,36 @@ def parse_timestamp_file(filepath: Path) -> list[dict]:
         filepath: Pfad zur Timestamp-Datei
 
     Returns:
-        Liste von Dictionaries mit 'start', 'title' und optional 'end'
+        Tupel (starts, ends, titles). Das Ende des letzten Clips ist None,
+        da es von der Video-Dauer abhängt.
     """
-    clips = []
+    starts = []
+    titles = []
     start_offset = 0.0
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    for line in lines:
-        line = line.strip()
+    text = filepath.read_text(encoding='utf-8')
 
-        # Leere Zeilen überspringen
-        if not line:
-            continue
+    # Alle Zeilen in einem Durchlauf, nicht passende Zeilen werden übersprungen
+    for match in _LINE_PATTERN.finditer(text):
+        offset, t1, t2, t3, title = match.groups()
 
-        # START: Offset parsen
-        if line.upper().startswith('START:'):
-            time_str = line[6:].strip()
-            start_offset = parse_time_to_seconds(time_str)
+        if t1 is None:
+            start_offset = parse_time_to_seconds(offset)
             continue
 
-        # Timestamp-Zeile parsen: "MM:SS Titel" oder "HH:MM:SS Titel"
-        match = re.match(r'^(\d{1,2}:\d{2}(?::\d{2})?)\s+(.+)$', line)
-        if match:
-            time_str, title = match.groups()
-            timestamp = parse_time_to_seconds(time_str)
-            clips.append({
-                'start': timestamp,
-                'title': title.strip()
-            })
+        # MM:SS bzw. HH:MM:SS direkt aus den Feldern berechnen
+        seconds = int(t1) * 60 + int(t2)
+        if t3 is not None:
+            seconds = seconds * 60 + int(t3)
 
-    # Start-Offset anwenden und End-Zeiten berechnen
-    for i, clip in enumerate(clips):
-        clip['start'] = clip['start'] - start_offset
+        starts.append(float(seconds))
+        titles.append(title.strip())
 
-        # End-Zeit ist der Start des nächsten Clips
-        if i < len(clips) - 1:
-            clip['end'] = clips[i + 1]['start'] - start_offset
+    # Start-Offset anwenden, End-Zeit ist der Start des nächsten Clips
+    starts = [start - start_offset for start in starts]
+    ends = starts[1:] + [None] if starts else []
 
-    return clips
+    return starts, ends, titles
 
 
 def sanitize_filename(title: str) -> str:
@@ -103,30 +182,112 @@ def sanitize_filename(title: str) -> str:
     Returns:
         Bereinigter Dateiname
     """
-    # Ersetze ungültige Zeichen durch Unterstriche
-    invalid_chars = r'<>:"/\|?*'
-    result = title
-    for char in invalid_chars:
-        result = result.replace(char, '_')
+    # Ungültige Zeichen durch Unterstriche ersetzen und mehrfache Unterstriche reduzieren
+    result = _MULTI_UNDERSCORE_PATTERN.sub('_', title.translate(_INVALID_CHARS_TABLE))
 
-    # Mehrfache Unterstriche zu einem reduzieren
-    result = re.sub(r'_+', '_', result)
+    # Leerzeichen durch Unterstriche ersetzen, führende/trailing Unterstriche entfernen,
+    # danach Kommas entfernen (häufig in Timestamps). Die Reihenfolge entspricht den
+    # bisherigen Dateinamen, damit vorhandene Clips weiterhin erkannt werden.
+    return result.translate(_SPACE_TABLE).strip('_').replace(',', '')
 
-    # Leerzeichen durch Unterstriche ersetzen
-    result = result.replace(' ', '_')
 
-    # Führende/trailing Unterstriche entfernen
-    result = result.strip('_')
+def read_mp4_duration(video_path: Path) -> Optional[float]:
+    """
+    Liest die Dauer einer MP4/MOV-Datei direkt aus dem mvhd-Atom (moov/mvhd).
 
-    # Kommas entfernen (häufig in Timestamps)
-    result = result.replace(',', '')
+    Args:
+        video_path: Pfad zur Videodatei
 
-    return result
+    Returns:
+        Dauer in Sekunden, None wenn die Datei kein lesbares MP4/MOV ist
+    """
+    try:
+        with open(video_path, 'rb') as f:
+            pos = 0
+            end = os.fstat(f.fileno()).st_size
+            first_box = True
+
+            while pos + 8 <= end:
+                f.seek(pos)
+                size, box_type = struct.unpack('>I4s', f.read(8))
+                header_size = 8
+
+                if size == 1:
+                    # 64-Bit-Boxgröße
+                    size = struct.unpack('>Q', f.read(8))[0]
+                    header_size = 16
+                elif size == 0:
+                    # Box reicht bis zum Ende des Containers
+                    size = end - pos
+
+                if size < header_size:
+                    return None
+
+                # Andere Container (z.B. Matroska) sofort ausschließen
+                if first_box and box_type not in _MP4_TOP_LEVEL_BOXES:
+                    return None
+                first_box = False
+
+                if box_type == b'moov':
+                    # In die moov-Box absteigen
+                    pos, end = pos + header_size, pos + size
+                    continue
+
+                if box_type == b'mvhd':
+                    version = f.read(4)[0]  # Version (1 Byte) + Flags (3 Bytes)
+                    if version == 1:
+                        f.seek(16, os.SEEK_CUR)  # creation/modification time (64 Bit)
+                        timescale, duration = struct.unpack('>IQ', f.read(12))
+                        unknown = 0xFFFFFFFFFFFFFFFF
+                    else:
+                        f.seek(8, os.SEEK_CUR)  # creation/modification time (32 Bit)
+                        timescale, duration = struct.unpack('>II', f.read(8))
+                        unknown = 0xFFFFFFFF
+
+                    # Fragmentierte MP4s haben oft keine Gesamtdauer im mvhd
+                    if not timescale or not duration or duration == unknown:
+                        return None
+                    return duration / timescale
+
+                pos += size
+    except (OSError, struct.error, IndexError):
+        return None
+
+    return None
+
+
+def load_duration_cache() -> dict:
+    """Lädt den Videolängen-Cache, bei fehlender oder defekter Datei einen leeren."""
+    global _duration_cache
+
+    if _duration_cache is None:
+        try:
+            with open(DURATION_CACHE_FILE, 'r', encoding='utf-8') as f:
+                _duration_cache = json.load(f)
+        except (OSError, ValueError):
+            _duration_cache = {}
+
+    return _duration_cache
+
+
+def save_duration_cache():
+    """Schreibt den Videolängen-Cache atomar (temporäre Datei + os.replace)."""
+    try:
+        DURATION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=DURATION_CACHE_FILE.parent)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(_duration_cache, f)
+        os.replace(tmp_path, DURATION_CACHE_FILE)
+    except OSError:
+        # Ohne Cache funktioniert alles weiter, nur langsamer
+        pass
 
 
 def get_video_duration(video_path: Path) -> float:
     """
-    Ermittelt die Dauer eines Videos mittels ffprobe.
+    Ermittelt die Dauer eines Videos. MP4/MOV-Dateien werden direkt gelesen,
+    alle anderen Formate mittels ffprobe. ffprobe-Ergebnisse werden anhand von
+    Pfad, Änderungszeit und Größe der Datei zwischengespeichert.
 
     Args:
         video_path: Pfad zur Videodatei
@@ -134,20 +295,254 @@ def get_video_duration(video_path: Path) -> float:
     Returns:
         Dauer in Sekunden
     """
+    # Andere Container gar nicht erst öffnen, sondern direkt an ffprobe geben
+    if video_path.suffix.lower() in _MP4_EXTENSIONS:
+        duration = read_mp4_duration(video_path)
+        if duration is not None:
+            return duration
+
+    stat = video_path.stat()
+    key = str(video_path.resolve())
+    cache = load_duration_cache()
+
+    entry = cache.get(key)
+    if entry is not None and entry[:2] == [stat.st_mtime_ns, stat.st_size]:
+        return entry[2]
+
+    duration = probe_video_duration(video_path)
+
+    cache[key] = [stat.st_mtime_ns, stat.st_size, duration]
+    save_duration_cache()
+
+    return duration
+
+
+def probe_video_duration(video_path: Path) -> float:
+    """Ermittelt die Dauer eines Videos mittels ffprobe."""
     cmd = [
         'ffprobe',
         '-v', 'error',
+        '-print_format', 'json',
         '-show_entries', 'format=duration',
-        '-of', 'default=noprint_wrappers=1:nokey=1',
         str(video_path)
     ]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(cmd, capture_output=True)
 
     if result.returncode != 0:
-        raise RuntimeError(f"ffprobe Fehler: {result.stderr}")
+        raise RuntimeError(f"ffprobe Fehler: {result.stderr.decode(errors='replace')}")
+
+    return float(json.loads(result.stdout)['format']['duration'])
+
+
+def run_ffmpeg(cmd: list[str]) -> tuple[bool, str]:
+    """
+    Führt einen FFmpeg-Befehl aus. Es werden nur Fehlermeldungen ausgegeben
+    (keine Fortschrittsanzeige), die über eine Pipe gesammelt werden.
+
+    Args:
+        cmd: FFmpeg-Befehl, beginnend mit 'ffmpeg'
+
+    Returns:
+        Tupel (Erfolg, letzte Fehlerzeilen von FFmpeg)
+    """
+    cmd = [cmd[0], '-nostats', '-loglevel', 'error', *cmd[1:]]
+
+    # communicate() liest stderr bis EOF, ohne dass FFmpeg an einer vollen Pipe hängen bleibt
+    proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE)
+    _, stderr = proc.communicate()
+
+    lines = stderr.decode(errors='replace').strip().splitlines()
+    return (proc.returncode == 0, '\n'.join(lines[-ERROR_TAIL_LINES:]))
+
+
+def get_ffmpeg_encoders() -> set[str]:
+    """Ermittelt die Encoder der installierten FFmpeg-Version (einmal pro Lauf)."""
+    global _ffmpeg_encoders
 
-    return float(result.stdout.strip())
+    if _ffmpeg_encoders is None:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                capture_output=True, text=True)
+
+        # Nach der Legende folgt pro Zeile "<Flags> <Name> <Beschreibung>"
+        _, _, listing = result.stdout.partition(' ------\n')
+        _ffmpeg_encoders = {line.split()[1] for line in listing.splitlines() if len(line.split()) > 1}
+
+    return _ffmpeg_encoders
+
+
+def hw_encoder_name(codec: str, hwaccel: str) -> str:
+    """Name des Hardware-Encoders, z.B. h264_nvenc oder hevc_vaapi."""
+    return f"{'hevc' if codec == 'h265' else 'h264'}_{hwaccel}"
+
+
+def hw_encoder_works(codec: str, hwaccel: str) -> bool:
+    """
+    Prüft mit einem kurzen Test-Encode, ob der Hardware-Encoder nutzbar ist.
+    Dass FFmpeg mit einem Encoder gebaut wurde, heißt nicht, dass GPU und
+    Treiber vorhanden sind.
+    """
+    cmd = [
+        'ffmpeg',
+        *_HWACCEL_INPUT_ARGS[hwaccel],
+        '-f', 'lavfi',
+        '-i', 'color=size=256x256:duration=0.2',
+        *build_codec_args(codec, 23, 'medium', hwaccel),
+        '-f', 'null', '-',
+    ]
+
+    success, _ = run_ffmpeg(cmd)
+    return success
+
+
+def resolve_hwaccel(hwaccel: str, codec: str) -> str:
+    """
+    Bestimmt die zu verwendende Hardware-Beschleunigung.
+
+    Args:
+        hwaccel: Gewählte Option (auto, none, nvenc, qsv, vaapi, videotoolbox)
+        codec: Video-Codec (h264, h265, copy)
+
+    Returns:
+        Konkrete Beschleunigung oder 'none' für Software-Encoding
+
+    Raises:
+        RuntimeError: Wenn der explizit gewählte Encoder nicht nutzbar ist
+    """
+    if codec == 'copy' or hwaccel == 'none':
+        return 'none'
+
+    candidates = HWACCEL_PRIORITY if hwaccel == 'auto' else [hwaccel]
+    encoders = get_ffmpeg_encoders()
+
+    for candidate in candidates:
+        if hw_encoder_name(codec, candidate) in encoders and hw_encoder_works(codec, candidate):
+            return candidate
+
+    if hwaccel == 'auto':
+        return 'none'
+
+    raise RuntimeError(f"Hardware-Encoder {hw_encoder_name(codec, hwaccel)} nicht verfügbar")
+
+
+def build_input_args(input_path: Path, start: float, hwaccel: str = 'none') -> list[str]:
+    """
+    Baut die Eingabe-Argumente inklusive Seek für FFmpeg.
+    Ein -ss vor -i springt zum Keyframe vor dem Start. Beim Re-Encoding verwirft
+    FFmpeg danach die Frames bis zum Start (-accurate_seek ist Standard), der Schnitt
+    ist also framegenau; Stream-Copy beginnt am Keyframe.
+
+    Args:
+        input_path: Pfad zum Quellvideo
+        start: Startzeit in Sekunden
+        hwaccel: Hardware-Beschleunigung (siehe resolve_hwaccel)
+
+    Returns:
+        Argumentliste bis einschließlich Eingabe
+    """
+    return [*_HWACCEL_INPUT_ARGS[hwaccel], '-ss', str(start), '-i', str(input_path)]
+
+
+def build_codec_args(codec: str, crf: int, preset: str, hwaccel: str = 'none') -> list[str]:
+    """
+    Baut die Codec-Argumente für FFmpeg (ohne Muxer-Optionen).
+
+    Args:
+        codec: Video-Codec (h264, h265, copy)
+        crf: Qualität (0-51, niedriger = besser)
+        preset: Encoding-Geschwindigkeit
+        hwaccel: Hardware-Beschleunigung (siehe resolve_hwaccel)
+
+    Returns:
+        Argumentliste für Video- und Audio-Codec
+    """
+    if codec == 'copy':
+        # Stream-Copy (schnell, keine Re-Encoding)
+        return ['-c', 'copy']
+
+    audio_args = ['-c:a', 'aac', '-b:a', '192k']
+
+    if hwaccel != 'none':
+        return [*build_hw_video_args(codec, crf, preset, hwaccel), *audio_args]
+
+    args = []
+
+    # Video-Codec
+    if codec == 'h264':
+        args.extend([
+            '-c:v', 'libx264',
+            '-profile:v', 'high',
+            '-level', '5.1',
+        ])
+    elif codec == 'h265':
+        args.extend([
+            '-c:v', 'libx265',
+            '-tag:v', 'hvc1',  # Für Apple-Kompatibilität
+        ])
+
+    args.extend([
+        '-crf', str(crf),
+        '-preset', preset,
+        '-pix_fmt', 'yuv420p',
+        *audio_args,
+    ])
+
+    return args
+
+
+def build_hw_video_args(codec: str, crf: int, preset: str, hwaccel: str) -> list[str]:
+    """
+    Baut die Video-Argumente für einen Hardware-Encoder. CRF und Preset werden
+    auf die nächstliegenden Qualitäts- und Geschwindigkeitsoptionen abgebildet.
+
+    Args:
+        codec: Video-Codec (h264, h265)
+        crf: Qualität (0-51, niedriger = besser)
+        preset: Encoding-Geschwindigkeit (x264-Namen)
+        hwaccel: Hardware-Beschleunigung (nvenc, qsv, vaapi, videotoolbox)
+
+    Returns:
+        Argumentliste für den Video-Codec
+    """
+    args = ['-c:v', hw_encoder_name(codec, hwaccel)]
+
+    if hwaccel == 'nvenc':
+        # Qualitätsgesteuertes VBR ohne Bitraten-Obergrenze, erzwungene Keyframes als IDR
+        args.extend([
+            '-preset', _NVENC_PRESETS[preset],
+            '-rc', 'vbr',
+            '-cq', str(crf),
+            '-b:v', '0',
+            '-forced-idr', '1',
+            '-pix_fmt', 'yuv420p',
+        ])
+    elif hwaccel == 'qsv':
+        # QSV kennt die x264-Presets ab veryfast
+        args.extend([
+            '-preset', preset if preset not in ('ultrafast', 'superfast') else 'veryfast',
+            '-global_quality', str(crf),
+            '-pix_fmt', 'nv12',
+        ])
+    elif hwaccel == 'vaapi':
+        # Software-dekodierte Frames auf die GPU laden, GPU-dekodierte direkt verwenden
+        args.extend([
+            '-vf', 'format=nv12|vaapi,hwupload',
+            '-qp', str(crf),
+        ])
+    elif hwaccel == 'videotoolbox':
+        # Qualität 1-100 (höher = besser), CRF 18 entspricht etwa 64
+        args.extend([
+            '-q:v', str(max(1, min(100, 100 - 2 * crf))),
+            '-pix_fmt', 'yuv420p',
+        ])
+
+    if codec == 'h265':
+        args.extend(['-tag:v', 'hvc1'])  # Für Apple-Kompatibilität
+    else:
+        args.extend(['-profile:v', 'high'])
+
+    return args
 
 
 def split_video(
@@ -157,7 +552,10 @@ def split_video(
     duration: float,
     codec: str = 'h264',
     crf: int = 18,
-    preset: str = 'medium'
+    preset: str = 'medium',
+    scratch_dir: Optional[Path] = None,
+    threads: int = FFMPEG_THREADS,
+    hwaccel: str = 'none'
 ) -> bool:
     """
     Extrahiert einen Clip aus einem Video mittels FFmpeg.
@@ -170,6 +568,10 @@ def split_video(
         codec: Video-Codec (h264, h265, copy)
         crf: Qualität (0-51, niedriger = besser)
         preset: Encoding-Geschwindigkeit
+        scratch_dir: Optionaler Zwischenordner, der Clip wird erst nach
+            erfolgreichem Schnitt an output_path verschoben
+        threads: Maximale Anzahl Threads dieses FFmpeg-Prozesses
+        hwaccel: Hardware-Beschleunigung (siehe resolve_hwaccel)
 
     Returns:
         True bei Erfolg, False bei Fehler
@@ -177,42 +579,45 @@ def split_video(
     cmd = [
         'ffmpeg',
         '-y',  # Überschreiben ohne Nachfrage
-        '-ss', str(start),
-        '-i', str(input_path),
+        *build_input_args(input_path, start, hwaccel),
         '-t', str(duration),
+        *build_codec_args(codec, crf, preset, hwaccel),
     ]
 
     if codec == 'copy':
-        # Stream-Copy (schnell, keine Re-Encoding)
-        cmd.extend(['-c', 'copy'])
+        # Beim Schnitt zwischen Keyframes beginnen Audio/Video mit negativen
+        # Zeitstempeln, die manche Player falsch abspielen
+        cmd.extend(['-avoid_negative_ts', 'make_zero'])
     else:
-        # Video-Codec
-        if codec == 'h264':
-            cmd.extend([
-                '-c:v', 'libx264',
-                '-profile:v', 'high',
-                '-level', '5.1',
-            ])
-        elif codec == 'h265':
-            cmd.extend([
-                '-c:v', 'libx265',
-                '-tag:v', 'hvc1',  # Für Apple-Kompatibilität
-            ])
+        cmd.extend(['-movflags', '+faststart'])
 
-        cmd.extend([
-            '-crf', str(crf),
-            '-preset', preset,
-            '-pix_fmt', 'yuv420p',
-            '-c:a', 'aac',
-            '-b:a', '192k',
-            '-movflags', '+faststart',
-        ])
+    # Threads pro Prozess begrenzen, da mehrere Clips parallel kodiert werden
+    cmd.extend(['-threads', str(threads)])
+
+    # Im Zwischenordner schreiben, damit Lesen der Quelle und Schreiben/faststart
+    # auf verschiedenen Datenträgern laufen und keine halben Clips im Ziel landen
+    if scratch_dir is not None:
+        fd, target = tempfile.mkstemp(suffix=output_path.suffix, dir=scratch_dir)
+        os.close(fd)
+        target = Path(target)
+    else:
+        target = output_path
+
+    cmd.append(str(target))
 
-    cmd.append(str(output_path))
+    success, error_tail = run_ffmpeg(cmd)
 
-    result = subprocess.run(cmd, stdout=subprocess.DEVNULL)
+    if target != output_path:
+        if success:
+            shutil.move(str(target), str(output_path))
+        else:
+            target.unlink(missing_ok=True)
 
-    return result.returncode == 0
+    if not success and error_tail:
+        # In einem Aufruf ausgeben, damit sich parallele Clips nicht vermischen
+        print(f"FFmpeg Fehler bei {output_path.name}:\n{error_tail}", flush=True)
+
+    return success
 
 
 def format_time(seconds: float) -> str:
@@ -231,17 +636,21 @@ def process_video(
     video_path: Path,
     timestamp_path: Path,
     output_dir: Path,
-    codec: str = 'h264',
-    crf: int = 18,
-    preset: str = 'medium',
     dry_run: bool = False,
-    prefix: str = ''
-) -> tuple[int, int, int]:
+    prefix: str = '',
+    planned_outputs: Optional[set[Path]] = None
+) -> tuple[list[Clip], int, int]:
     """
-    Verarbeitet ein einzelnes Video anhand einer Timestamp-Datei.
+    Bereitet ein einzelnes Video anhand einer Timestamp-Datei vor.
+    Die Clips werden nicht hier geschnitten, sondern als Jobs zurückgegeben,
+    damit split_clips sie (auch über mehrere Videos hinweg) parallel ausführen kann.
+
+    Args:
+        planned_outputs: Ausgabepfade, die bereits als Job geplant sind (Batch-Modus).
+            Solche Clips werden wie vorhandene übersprungen, neue Pfade werden ergänzt.
 
     Returns:
-        Tupel (success_count, skipped_count, error_count)
+        Tupel (jobs, skipped_count, error_count)
     """
     # Video-Dauer ermitteln
     print(f"\nVideo: {video_path.name}")
@@ -250,91 +659,416 @@ def process_video(
         print(f"Dauer: {format_time(video_duration)}")
     except RuntimeError as e:
         print(f"Fehler: {e}")
-        return (0, 0, 1)
+        return ([], 0, 1)
 
     # Timestamps parsen
     print(f"Timestamp-Datei: {timestamp_path.name}")
     try:
-        clips = parse_timestamp_file(timestamp_path)
+        starts, ends, titles = parse_timestamp_file(timestamp_path)
     except Exception as e:
         print(f"Fehler beim Parsen der Timestamps: {e}")
-        return (0, 0, 1)
+        return ([], 0, 1)
 
-    if not clips:
+    if not starts:
         print("Keine Timestamps gefunden!")
-        return (0, 0, 1)
+        return ([], 0, 1)
 
     # Letzten Clip mit Video-Ende abschließen
-    if 'end' not in clips[-1]:
-        clips[-1]['end'] = video_duration - clips[0]['start']
+    ends[-1] = video_duration - starts[0]
+    num_clips = len(starts)
 
-    print(f"Gefunden: {len(clips)} Clips\n")
+    print(f"Gefunden: {num_clips} Clips\n")
 
     # Clips anzeigen
     print("=" * 60)
     print(f"{'Nr':<4} {'Start':<10} {'Ende':<10} {'Dauer':<8} Titel")
     print("=" * 60)
 
-    for i, clip in enumerate(clips, 1):
-        start = clip['start']
-        end = clip.get('end', video_duration)
+    for i in range(num_clips):
+        start, end = starts[i], ends[i]
         duration = end - start
 
-        print(f"{i:02d}   {format_time(start):<10} {format_time(end):<10} "
-              f"{format_time(duration):<8} {clip['title']}")
+        print(f"{i + 1:02d}   {format_time(start):<10} {format_time(end):<10} "
+              f"{format_time(duration):<8} {titles[i]}")
 
     print("=" * 60)
 
     if dry_run:
         print("\n[DRY-RUN] Keine Clips wurden erstellt.")
-        return (0, 0, 0)
+        return ([], 0, 0)
 
     # Ausgabeverzeichnis erstellen
     output_dir.mkdir(parents=True, exist_ok=True)
     print(f"\nAusgabe: {output_dir}\n")
 
-    # Clips extrahieren
-    success_count = 0
-    error_count = 0
+    jobs = []
     skipped_count = 0
 
-    for i, clip in enumerate(clips, 1):
-        start = clip['start']
-        end = clip.get('end', video_duration)
-        duration = end - start
+    pfx = f"{prefix}_" if prefix else ""
+
+    for i in range(num_clips):
+        start = starts[i]
+        duration = ends[i] - start
 
         # Dateiname generieren
-        title_clean = sanitize_filename(clip['title'])
-        pfx = f"{prefix}_" if prefix else ""
-        filename = f"{pfx}{i:02d}_{title_clean}.mp4"
+        title_clean = sanitize_filename(titles[i])
+        filename = f"{pfx}{i + 1:02d}_{title_clean}.mp4"
         output_path = output_dir / filename
 
-        # Bereits vorhandene Clips überspringen
-        if output_path.exists():
-            print(f"[{i}/{len(clips)}] {filename} — ÜBERSPRUNGEN (existiert bereits)")
+        # Bereits vorhandene oder von einem früheren Batch-Eintrag geplante Clips überspringen
+        if output_path.exists() or (planned_outputs is not None and output_path in planned_outputs):
+            print(f"[{i + 1}/{num_clips}] {filename} — ÜBERSPRUNGEN (existiert bereits)")
             skipped_count += 1
             continue
 
-        print(f"\n[{i}/{len(clips)}] {filename}", flush=True)
+        if planned_outputs is not None:
+            planned_outputs.add(output_path)
+
+        jobs.append(Clip(video_path, output_path, start, duration, video_duration))
+
+    return (jobs, skipped_count, 0)
+
+
+def split_video_segments(
+    jobs: list[Clip],
+    codec: str = 'h264',
+    crf: int = 18,
+    preset: str = 'medium',
+    scratch_dir: Optional[Path] = None,
+    threads: int = FFMPEG_THREADS,
+    hwaccel: str = 'none'
+) -> bool:
+    """
+    Schneidet lückenlos aufeinanderfolgende Clips eines Videos in einem einzigen
+    FFmpeg-Durchlauf mit dem Segment-Muxer. Die Segmente werden in einen
+    temporären Ordner geschrieben und anhand der Segmentliste umbenannt.
+    Nur für Re-Encoding: Bei Stream-Copy trennt der Muxer erst am nächsten
+    Keyframe nach dem Schnittpunkt, die Clips würden also später beginnen
+    als beim Einzelschnitt (der am Keyframe davor ansetzt).
+
+    Args:
+        jobs: Clip-Jobs desselben Videos in zeitlicher Reihenfolge
+        codec: Video-Codec (h264, h265)
+        crf: Qualität (0-51, niedriger = besser)
+        preset: Encoding-Geschwindigkeit
+        scratch_dir: Optionaler Zwischenordner für die Segmente (Standard: Ausgabeordner)
+        threads: Maximale Anzahl Threads des FFmpeg-Prozesses
+        hwaccel: Hardware-Beschleunigung (siehe resolve_hwaccel)
+
+    Returns:
+        True bei Erfolg, False bei Fehler
+    """
+    first, last = jobs[0], jobs[-1]
+    start = first.start
+    duration = last.start + last.duration - start
+    segment_times = ','.join(str(job.start - start) for job in jobs[1:])
+
+    segment_dir = Path(tempfile.mkdtemp(
+        prefix='.segments_',
+        dir=scratch_dir or first.output_path.parent
+    ))
+    segment_list = segment_dir / 'segments.csv'
+
+    try:
+        cmd = [
+            'ffmpeg',
+            '-y',
+            *build_input_args(first.input_path, start, hwaccel),
+            '-t', str(duration),
+            *build_codec_args(codec, crf, preset, hwaccel),
+            # Keyframes genau an den Schnittpunkten erzwingen, damit jedes Segment
+            # exakt am Clip-Start beginnt
+            '-force_key_frames', segment_times,
+            '-threads', str(threads),
+            '-segment_format_options', 'movflags=+faststart',
+        ]
+
+        cmd.extend([
+            '-f', 'segment',
+            '-segment_times', segment_times,
+            '-segment_list', str(segment_list),
+            '-segment_list_type', 'csv',
+            '-reset_timestamps', '1',
+            str(segment_dir / 'segment_%03d.mp4'),
+        ])
+
+        # Fehler hier nicht ausgeben, die Clips werden danach einzeln geschnitten
+        success, _ = run_ffmpeg(cmd)
+
+        if not success:
+            return False
+
+        # Segmentliste: eine Zeile "Dateiname,Start,Ende" pro geschriebenem Segment
+        with open(segment_list, 'r', encoding='utf-8', newline='') as f:
+            segments = [segment_dir / row[0] for row in csv.reader(f) if row]
+
+        # Sicherheitsnetz: ohne ein Segment pro Clip wird einzeln geschnitten
+        if len(segments) != len(jobs):
+            return False
+
+        for segment, job in zip(segments, jobs):
+            shutil.move(str(segment), str(job.output_path))
+
+        return True
+    finally:
+        shutil.rmtree(segment_dir, ignore_errors=True)
+
+
+def split_video_multi(
+    jobs: list[Clip],
+    scratch_dir: Optional[Path] = None,
+    threads: int = FFMPEG_THREADS
+) -> bool:
+    """
+    Schneidet mehrere Clips eines Videos per Stream-Copy in einem einzigen
+    FFmpeg-Prozess: jeder Clip bekommt eine eigene Eingabe mit schnellem Seek
+    und eine eigene Ausgabe. Im Gegensatz zum Segment-Muxer müssen die Clips
+    nicht lückenlos aufeinander folgen, und dazwischenliegende Abschnitte
+    werden weder gelesen noch geschrieben.
+
+    Args:
+        jobs: Clip-Jobs desselben Videos
+        scratch_dir: Optionaler Zwischenordner für die Clips (Standard: Ausgabeordner)
+        threads: Maximale Anzahl Threads des FFmpeg-Prozesses
+
+    Returns:
+        True bei Erfolg, False bei Fehler
+    """
+    output_dir = Path(tempfile.mkdtemp(
+        prefix='.clips_',
+        dir=scratch_dir or jobs[0].output_path.parent
+    ))
+
+    try:
+        cmd = ['ffmpeg', '-y']
+
+        for job in jobs:
+            cmd.extend(build_input_args(job.input_path, job.start))
+
+        targets = [output_dir / f"clip_{i:03d}.mp4" for i in range(len(jobs))]
+
+        for i, (job, target) in enumerate(zip(jobs, targets)):
+            cmd.extend([
+                '-map', f'{i}:v:0',
+                '-map', f'{i}:a:0?',
+                '-t', str(job.duration),
+                *build_codec_args('copy', 0, ''),
+                '-avoid_negative_ts', 'make_zero',
+                '-threads', str(threads),
+                str(target),
+            ])
+
+        # Fehler hier nicht ausgeben, die Clips werden danach einzeln geschnitten
+        success, _ = run_ffmpeg(cmd)
+
+        if not success:
+            return False
+
+        for target, job in zip(targets, jobs):
+            shutil.move(str(target), str(job.output_path))
+
+        return True
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def clips_are_contiguous(jobs: list[Clip]) -> bool:
+    """Prüft, ob jeder Clip genau dort beginnt, wo der vorherige endet."""
+    return all(
+        abs(previous.start + previous.duration - job.start) < 1e-6
+        for previous, job in zip(jobs, jobs[1:])
+    )
+
+
+def group_jobs(jobs: list[Clip], codec: str, single_pass: bool = False) -> list[list[Clip]]:
+    """
+    Fasst Jobs zu Gruppen zusammen, die in einem FFmpeg-Aufruf geschnitten werden.
+    Bei Stream-Copy bilden aufeinanderfolgende Clips desselben Videos eine Gruppe
+    (auch mit Lücken, z.B. durch bereits vorhandene Clips), mit single_pass beim
+    Re-Encoding nur lückenlos aufeinanderfolgende. Sonst wird jeder Clip einzeln
+    (und parallel) kodiert.
+    """
+    if codec != 'copy' and not single_pass:
+        return [[job] for job in jobs]
+
+    groups = []
+
+    for job in jobs:
+        group = groups[-1] if groups else None
+        if (group is not None
+                and group[-1].input_path == job.input_path
+                and len(group) < MULTI_OUTPUT_MAX_CLIPS
+                and (codec == 'copy' or clips_are_contiguous([group[-1], job]))):
+            group.append(job)
+        else:
+            groups.append([job])
+
+    return groups
+
+
+def prefetch_source_range(jobs: list[Clip]):
+    """
+    Kündigt dem Kernel an, welche Teile der Quelldatei gleich gelesen werden
+    (posix_fadvise WILLNEED), damit das Einlesen schon während des
+    FFmpeg-Starts beginnt. Die Byte-Bereiche werden pro Clip anhand der Zeit
+    geschätzt, Lücken zwischen den Clips einer Gruppe werden nicht gelesen.
+    Insgesamt werden höchstens PREFETCH_MAX_BYTES angekündigt.
+    Auf Systemen ohne posix_fadvise (Windows, macOS) passiert nichts.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    source_duration = jobs[0].source_duration
+    if source_duration <= 0:
+        return
+
+    try:
+        size = jobs[0].input_path.stat().st_size
+        budget = PREFETCH_MAX_BYTES
+
+        fd = os.open(jobs[0].input_path, os.O_RDONLY)
+        try:
+            for job in jobs:
+                # Bei annähernd konstanter Bitrate wächst die Byte-Position linear mit der Zeit
+                start = job.start / source_duration
+                end = (job.start + job.duration) / source_duration
+                offset = int(size * min(start, 1.0))
+                length = min(int(size * min(end, 1.0)) - offset, budget)
+
+                if length <= 0:
+                    continue
+
+                os.posix_fadvise(fd, offset, length, os.POSIX_FADV_WILLNEED)
+                budget -= length
+
+                if budget <= 0:
+                    break
+        finally:
+            os.close(fd)
+    except OSError:
+        # Nur ein Hinweis an den Kernel, Fehler sind unkritisch
+        pass
+
+
+def split_group(
+    jobs: list[Clip],
+    codec: str = 'h264',
+    crf: int = 18,
+    preset: str = 'medium',
+    scratch_dir: Optional[Path] = None,
+    threads: int = FFMPEG_THREADS,
+    hwaccel: str = 'none'
+) -> bool:
+    """
+    Schneidet eine Job-Gruppe in einem FFmpeg-Aufruf. Beim Re-Encoding werden
+    lückenlose Clips per Segment-Muxer in einem Durchlauf geschnitten, bei
+    Stream-Copy alle Clips in einem gemeinsamen FFmpeg-Prozess mit eigenem Seek
+    pro Clip. Einzelne Clips werden direkt mit split_video geschnitten.
+
+    Returns:
+        True bei Erfolg. Bei False für eine Gruppe mit mehreren Clips wurde noch
+        nichts geschrieben, der Aufrufer schneidet die Clips dann einzeln.
+    """
+    prefetch_source_range(jobs)
+
+    if len(jobs) == 1:
+        job = jobs[0]
+        return split_video(job.input_path, job.output_path, job.start, job.duration,
+                           codec=codec, crf=crf, preset=preset,
+                           scratch_dir=scratch_dir, threads=threads, hwaccel=hwaccel)
 
-        success = split_video(
-            input_path=video_path,
-            output_path=output_path,
-            start=start,
-            duration=duration,
+    if codec != 'copy':
+        return clips_are_contiguous(jobs) and split_video_segments(
+            jobs,
             codec=codec,
             crf=crf,
-            preset=preset
+            preset=preset,
+            scratch_dir=scratch_dir,
+            threads=threads,
+            hwaccel=hwaccel
         )
 
-        if success:
-            print("OK")
-            success_count += 1
-        else:
-            print("FEHLER")
-            error_count += 1
+    return split_video_multi(jobs, scratch_dir=scratch_dir, threads=threads)
+
+
+def split_clips(
+    jobs: list[Clip],
+    codec: str = 'h264',
+    crf: int = 18,
+    preset: str = 'medium',
+    scratch_dir: Optional[Path] = None,
+    parallel_jobs: int = PARALLEL_JOBS,
+    threads_per_job: int = FFMPEG_THREADS,
+    single_pass: bool = False,
+    hwaccel: str = 'none'
+) -> tuple[int, int]:
+    """
+    Schneidet alle Clip-Jobs mit mehreren parallel laufenden FFmpeg-Prozessen.
+    Das Warten auf FFmpeg gibt den GIL frei, daher genügen Threads.
+    Scheitert eine Gruppe, werden ihre Clips einzeln neu eingereiht.
+
+    Returns:
+        Tupel (success_count, error_count)
+    """
+    success_count = 0
+    error_count = 0
 
-    return (success_count, skipped_count, error_count)
+    if not jobs:
+        return (success_count, error_count)
+
+    groups = group_jobs(jobs, codec, single_pass)
+
+    # Mit --single-pass ist jedes Video ein einziger Encode: die Kerne auf die
+    # gleichzeitig laufenden Gruppen verteilen statt nur threads_per_job zu nutzen
+    group_threads = threads_per_job
+    if single_pass and codec != 'copy':
+        running = min(parallel_jobs, len(groups))
+        group_threads = max(threads_per_job, (os.cpu_count() or 1) // running)
+
+    print(f"Schneide {len(jobs)} Clips mit bis zu {parallel_jobs} parallelen FFmpeg-Prozessen "
+          f"({group_threads} Threads pro Prozess)\n")
+
+    with ThreadPoolExecutor(max_workers=parallel_jobs) as executor:
+        def submit(group: list[Clip], threads: int):
+            return executor.submit(
+                split_group,
+                group,
+                codec=codec,
+                crf=crf,
+                preset=preset,
+                scratch_dir=scratch_dir,
+                threads=threads,
+                hwaccel=hwaccel
+            )
+
+        pending = {submit(group, group_threads): group for group in groups}
+
+        done = 0
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in finished:
+                group = pending.pop(future)
+                success = future.result()
+
+                if not success and len(group) > 1:
+                    # Einzelschnitte zurück in den Pool, damit sie parallel laufen
+                    for job in group:
+                        pending[submit([job], threads_per_job)] = [job]
+                    continue
+
+                for job in group:
+                    done += 1
+                    filename = job.output_path.name
+
+                    if success:
+                        print(f"[{done}/{len(jobs)}] {filename} — OK", flush=True)
+                        success_count += 1
+                    else:
+                        print(f"[{done}/{len(jobs)}] {filename} — FEHLER", flush=True)
+                        error_count += 1
+
+    return (success_count, error_count)
 
 
 def parse_batch_file(filepath: Path) -> list[tuple[Path, Path]]:
@@ -432,6 +1166,37 @@ def main():
                  'medium', 'slow', 'slower', 'veryslow'],
         help="Encoding-Geschwindigkeit (Standard: medium)"
     )
+    parser.add_argument(
+        "--hwaccel",
+        type=str,
+        choices=['auto', 'none', *HWACCEL_PRIORITY],
+        default='none',
+        help="Hardware-Encoder verwenden, auto wählt den ersten nutzbaren (Standard: none)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Anzahl parallel laufender FFmpeg-Prozesse "
+             f"(Standard: Hälfte der CPU-Kerne, mit Hardware-Encoder {HW_PARALLEL_JOBS})"
+    )
+    parser.add_argument(
+        "--threads-per-job",
+        type=int,
+        default=FFMPEG_THREADS,
+        help="Threads pro FFmpeg-Prozess (Standard: 2)"
+    )
+    parser.add_argument(
+        "--single-pass",
+        action="store_true",
+        help="Alle Clips eines Videos in einem FFmpeg-Durchlauf schneiden, auch beim Re-Encoding"
+    )
+    parser.add_argument(
+        "--scratch-dir",
+        type=str,
+        default=None,
+        help="Zwischenordner für Clips, z.B. auf einem anderen Datenträger (Standard: keiner)"
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -457,6 +1222,9 @@ def main():
 
     args = parser.parse_args()
 
+    if (args.jobs is not None and args.jobs < 1) or args.threads_per_job < 1:
+        parser.error("--jobs und --threads-per-job müssen mindestens 1 sein")
+
     # Entweder --batch oder video + timestamps
     if args.batch:
         batch_path = Path(args.batch).resolve()
@@ -468,19 +1236,36 @@ def main():
     else:
         parser.error("Entweder --batch DATEI oder VIDEO TIMESTAMPS angeben")
 
-    # FFmpeg Verfügbarkeit prüfen
-    try:
-        subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
-        subprocess.run(['ffprobe', '-version'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # FFmpeg Verfügbarkeit prüfen (nur im PATH suchen, ohne die Programme zu starten)
+    if shutil.which('ffmpeg') is None or shutil.which('ffprobe') is None:
         print("Fehler: FFmpeg nicht gefunden. Bitte installieren:")
         print("  Ubuntu/Debian: sudo apt install ffmpeg")
         print("  macOS: brew install ffmpeg")
         print("  Windows: https://ffmpeg.org/download.html")
         return 1
 
+    try:
+        hwaccel = resolve_hwaccel(args.hwaccel, args.codec)
+    except RuntimeError as e:
+        print(f"Fehler: {e}")
+        return 1
+
+    if hwaccel != 'none':
+        print(f"Hardware-Encoder: {hw_encoder_name(args.codec, hwaccel)}")
+    elif args.hwaccel == 'auto' and args.codec != 'copy':
+        print("Kein Hardware-Encoder gefunden, verwende Software-Encoding")
+
+    # Mehrere Hardware-Encodes teilen sich eine GPU, daher weniger parallele Prozesse
+    if args.jobs is None:
+        args.jobs = HW_PARALLEL_JOBS if hwaccel != 'none' else PARALLEL_JOBS
+
     output_dir = Path(args.output).resolve()
 
+    scratch_dir = None
+    if args.scratch_dir:
+        scratch_dir = Path(args.scratch_dir).resolve()
+        scratch_dir.mkdir(parents=True, exist_ok=True)
+
     # Batch-Modus
     if args.batch:
         pairs = parse_batch_file(batch_path)
@@ -491,7 +1276,8 @@ def main():
         print(f"Batch-Modus: {len(pairs)} Videos")
         print("=" * 60)
 
-        total_success = 0
+        all_jobs = []
+        planned_outputs = set()  # Alle Clips werden erst nach der Planung geschnitten
         total_skipped = 0
         total_errors = 0
 
@@ -510,21 +1296,33 @@ def main():
                 total_errors += 1
                 continue
 
-            success, skipped, errors = process_video(
+            jobs, skipped, errors = process_video(
                 video_path=video_path,
                 timestamp_path=timestamp_path,
                 output_dir=output_dir,
-                codec=args.codec,
-                crf=args.crf,
-                preset=args.preset,
                 dry_run=args.dry_run,
-                prefix=args.prefix
+                prefix=args.prefix,
+                planned_outputs=planned_outputs
             )
 
-            total_success += success
+            all_jobs.extend(jobs)
             total_skipped += skipped
             total_errors += errors
 
+        # Clips aller Videos gemeinsam schneiden, damit am Ende kein Leerlauf entsteht
+        total_success, errors = split_clips(
+            all_jobs,
+            codec=args.codec,
+            crf=args.crf,
+            preset=args.preset,
+            scratch_dir=scratch_dir,
+            parallel_jobs=args.jobs,
+            threads_per_job=args.threads_per_job,
+            single_pass=args.single_pass,
+            hwaccel=hwaccel
+        )
+        total_errors += errors
+
         # Gesamtzusammenfassung
         print(f"\n{'=' * 60}")
         print(f"GESAMT: {len(pairs)} Videos verarbeitet")
@@ -553,16 +1351,26 @@ def main():
             print(f"Fehler: Timestamp-Datei nicht gefunden: {timestamp_path}")
             return 1
 
-        success, skipped, errors = process_video(
+        jobs, skipped, errors = process_video(
             video_path=video_path,
             timestamp_path=timestamp_path,
             output_dir=output_dir,
+            dry_run=args.dry_run,
+            prefix=args.prefix
+        )
+
+        success, split_errors = split_clips(
+            jobs,
             codec=args.codec,
             crf=args.crf,
             preset=args.preset,
-            dry_run=args.dry_run,
-            prefix=args.prefix
+            scratch_dir=scratch_dir,
+            parallel_jobs=args.jobs,
+            threads_per_job=args.threads_per_job,
+            single_pass=args.single_pass,
+            hwaccel=hwaccel
         )
+        errors += split_errors
 
         # Zusammenfassung
         parts = []
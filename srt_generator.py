@@ -8,7 +8,9 @@ die den aktuellen Song-Titel und Artist anzeigt.
 
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
 
 # ===== KONFIGURATION =====
 
@@ -41,23 +43,47 @@ PLAYLIST_STARTS = [
 
 # ===== ENDE KONFIGURATION =====
 
+# Eine Zeile der Timestamp-Datei: "=== PLAYLIST N ===" Header oder "MM:SS Titel" / "HH:MM:SS Titel".
+# Die Zeitfelder werden einzeln erfasst, bei MM:SS ist das dritte Feld leer.
+_CHAPTERS_LINE_PATTERN = re.compile(
+    r'^[^\S\n]*(?:(?P<header>=+[^\S\n]*PLAYLIST[^\S\n]+\d+[^\S\n]*=+)'
+    r'|(?P<t1>\d{1,2}):(?P<t2>\d{2})(?::(?P<t3>\d{2}))?[^\S\n]+(?P<title>.+?))[^\S\n]*$',
+    re.IGNORECASE | re.MULTILINE
+)
 
+
+class Chapter(NamedTuple):
+    """Ein Song innerhalb einer Playlist (Start relativ zum Playlist-Beginn)."""
+    start: float
+    title: str
+
+
+class Subtitle(NamedTuple):
+    """Ein Untertitel-Eintrag mit absoluten Zeiten in Sekunden."""
+    index: int
+    start: float
+    end: float
+    text: str
+    playlist: int
+
+
+@lru_cache(maxsize=None)
 def parse_time_to_seconds(time_str: str) -> float:
-    """Konvertiert MM:SS oder HH:MM:SS in Sekunden."""
-    parts = time_str.strip().split(':')
-    if len(parts) == 2:
-        return int(parts[0]) * 60 + float(parts[1])
-    elif len(parts) == 3:
-        return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
-    else:
+    """Konvertiert MM:SS oder HH:MM:SS in Sekunden (gecacht, da sich Zeitangaben wiederholen)."""
+    # Von rechts zerlegen: Sekunden, Minuten und (optional) Stunden
+    rest, separator, secs = time_str.strip().rpartition(':')
+    hours, _, minutes = rest.rpartition(':')
+
+    if not separator or ':' in hours:
         raise ValueError(f"Ungültiges Zeitformat: {time_str}")
 
+    return int(hours or 0) * 3600 + int(minutes) * 60 + float(secs)
+
 
 def seconds_to_srt_time(seconds: float) -> str:
     """Konvertiert Sekunden in SRT-Zeitformat HH:MM:SS,mmm."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
     millis = int((seconds % 1) * 1000)
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
@@ -67,50 +93,48 @@ def clean_title(title: str) -> str:
     return re.sub(r'\s*\([^)]*\)\s*$', '', title).strip()
 
 
-def parse_chapters_file(filepath: Path) -> list[list[dict]]:
+def parse_chapters_file(filepath: Path) -> list[list[Chapter]]:
     """
     Parst eine Timestamp-Datei mit Playlist-Sektionen.
 
     Sektionen werden durch '=== PLAYLIST N ===' Header getrennt.
 
     Returns:
-        Liste von Playlists, jede Playlist ist eine Liste von {'start': float, 'title': str}
+        Liste von Playlists, jede Playlist ist eine Liste von Chapter-Einträgen
     """
-    with open(filepath, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    text = filepath.read_text(encoding='utf-8')
 
     playlists = []
     current_entries = None
-    playlist_header = re.compile(r'^=+\s*PLAYLIST\s+\d+\s*=+$', re.IGNORECASE)
 
-    for line in lines:
-        line = line.strip()
+    # START:-Zeilen und sonstiger Text passen nicht auf das Muster und entfallen
+    for match in _CHAPTERS_LINE_PATTERN.finditer(text):
+        header, t1, t2, t3, title = match.groups()
 
-        if playlist_header.match(line):
+        if header is not None:
             current_entries = []
             playlists.append(current_entries)
             continue
 
-        if current_entries is None or not line or line.upper().startswith('START:'):
+        if current_entries is None:
             continue
 
-        match = re.match(r'^(\d{1,2}:\d{2}(?::\d{2})?)\s+(.+)$', line)
-        if match:
-            time_str, title = match.groups()
-            current_entries.append({
-                'start': parse_time_to_seconds(time_str),
-                'title': clean_title(title),
-            })
+        # MM:SS bzw. HH:MM:SS direkt aus den Feldern berechnen
+        seconds = int(t1) * 60 + int(t2)
+        if t3 is not None:
+            seconds = seconds * 60 + int(t3)
+
+        current_entries.append(Chapter(float(seconds), clean_title(title)))
 
     return playlists
 
 
-def generate_subtitles() -> list[dict]:
+def generate_subtitles() -> list[Subtitle]:
     """
     Generiert alle Untertitel-Einträge aus den Timestamp-Dateien.
 
     Returns:
-        Liste von {'index': int, 'start': float, 'end': float, 'text': str}
+        Liste von Subtitle-Einträgen
     """
     timestamps_file = Path(TIMESTAMPS_FILE)
     if not timestamps_file.is_file():
@@ -136,14 +160,7 @@ def generate_subtitles() -> list[dict]:
     for time_str in PLAYLIST_STARTS:
         playlist_abs_starts.append(parse_time_to_seconds(time_str))
 
-    # Endzeiten berechnen
     video_duration = parse_time_to_seconds(VIDEO_DURATION)
-    playlist_ends = []
-    for i in range(len(playlists)):
-        if i < len(playlists) - 1:
-            playlist_ends.append(playlist_abs_starts[i + 1] - TRANSITION_DURATION)
-        else:
-            playlist_ends.append(video_duration)
 
     # Untertitel generieren
     subtitles = []
@@ -155,63 +172,64 @@ def generate_subtitles() -> list[dict]:
             continue
 
         abs_start = playlist_abs_starts[pl_idx]
-        playlist_end = playlist_ends[pl_idx]
+
+        # Eine Playlist endet mit dem Übergang zur nächsten, die letzte mit dem Video
+        if pl_idx + 1 < len(playlist_abs_starts):
+            playlist_end = playlist_abs_starts[pl_idx + 1] - TRANSITION_DURATION
+        else:
+            playlist_end = video_duration
 
         print(f"\nPlaylist {pl_idx + 1}: "
               f"{len(entries)} Songs, "
               f"Start {seconds_to_srt_time(abs_start)}, "
               f"Ende {seconds_to_srt_time(playlist_end)}")
 
-        for i, entry in enumerate(entries):
-            sub_start = abs_start + entry['start']
+        # Jeder Song endet mit dem Start des nächsten, der letzte mit der Playlist
+        sub_starts = [abs_start + entry.start for entry in entries]
+        sub_ends = sub_starts[1:] + [playlist_end]
 
-            if i < len(entries) - 1:
-                sub_end = abs_start + entries[i + 1]['start']
-            else:
-                sub_end = playlist_end
-
-            subtitles.append({
-                'index': index,
-                'start': sub_start,
-                'end': sub_end,
-                'text': entry['title'],
-                'playlist': pl_idx + 1,
-            })
-            index += 1
+        subtitles.extend(
+            Subtitle(index + i, sub_start, sub_end, entry.title, pl_idx + 1)
+            for i, (entry, sub_start, sub_end) in enumerate(zip(entries, sub_starts, sub_ends))
+        )
+        index += len(entries)
 
     return subtitles
 
 
 def seconds_to_hhmmss(seconds: float) -> str:
     """Konvertiert Sekunden in HH:MM:SS Format (ohne Millisekunden)."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
-def write_youtube_timestamps(subtitles: list[dict], output_path: str):
+def write_youtube_timestamps(subtitles: list[Subtitle], output_path: str):
     """Schreibt YouTube-Kommentar-Timestamps (HH:MM:SS TITLE), nach Playlists unterteilt."""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write("Song Timestamps\n\n")
-        current_playlist = None
-        for sub in subtitles:
-            if sub['playlist'] != current_playlist:
-                if current_playlist is not None:
-                    f.write("\n")
-                f.write(f"Playlist {sub['playlist']}\n")
-                current_playlist = sub['playlist']
-            f.write(f"{seconds_to_hhmmss(sub['start'])} {sub['text']}\n")
-
-
-def write_srt(subtitles: list[dict], output_path: str):
+    parts = ["Song Timestamps\n\n"]
+    current_playlist = None
+
+    for sub in subtitles:
+        if sub.playlist != current_playlist:
+            if current_playlist is not None:
+                parts.append("\n")
+            parts.append(f"Playlist {sub.playlist}\n")
+            current_playlist = sub.playlist
+        parts.append(f"{seconds_to_hhmmss(sub.start)} {sub.text}\n")
+
+    # Gesamten Inhalt einmal kodieren und mit einem einzigen write schreiben
+    Path(output_path).write_bytes(''.join(parts).encode('utf-8'))
+
+
+def write_srt(subtitles: list[Subtitle], output_path: str):
     """Schreibt die Untertitel in eine .srt-Datei."""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        for sub in subtitles:
-            f.write(f"{sub['index']}\n")
-            f.write(f"{seconds_to_srt_time(sub['start'])} --> {seconds_to_srt_time(sub['end'])}\n")
-            f.write(f"{sub['text']}\n")
-            f.write("\n")
+    srt_time = seconds_to_srt_time
+
+    content = ''.join(
+        f"{sub.index}\n{srt_time(sub.start)} --> {srt_time(sub.end)}\n{sub.text}\n\n"
+        for sub in subtitles
+    )
+    Path(output_path).write_bytes(content.encode('utf-8'))
 
 
 def main():